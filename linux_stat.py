@@ -0,0 +1,106 @@
+"""
+Thin ctypes wrapper around Linux statx(2) for fast size/mode lookups.
+
+statx with AT_STATX_DONT_SYNC asks the kernel for whatever attribute values
+are already cached (no forced writeback / no remote round-trip on network
+filesystems) and requests only the fields we actually read
+(STATX_SIZE | STATX_MODE | STATX_MTIME) instead of the full 144-byte stat
+result.
+
+On non-Linux platforms, or on kernels without statx (< 4.11), statx_fast
+transparently falls back to os.stat. The availability probe runs once per
+process and its result is cached.
+"""
+import ctypes
+import os
+import sys
+
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_MODE = 0x0002
+STATX_MTIME = 0x0040
+STATX_SIZE = 0x0200
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """Mirror of struct statx from <linux/stat.h>."""
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("_spare2", ctypes.c_uint64 * 14),
+    ]
+
+_REQUEST_MASK = STATX_SIZE | STATX_MODE | STATX_MTIME
+_FLAGS = AT_SYMLINK_NOFOLLOW | AT_STATX_DONT_SYNC
+
+# None = not probed yet, False = unavailable, else the bound libc function
+_statx = None
+
+
+def _probe():
+    """One-time runtime check that libc exposes a working statx()."""
+    global _statx
+    if not sys.platform.startswith("linux"):
+        _statx = False
+        return _statx
+    try:
+        libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        fn = libc.statx
+        fn.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                       ctypes.c_uint, ctypes.POINTER(_Statx)]
+        fn.restype = ctypes.c_int
+        buf = _Statx()
+        if fn(AT_FDCWD, b".", _FLAGS, _REQUEST_MASK, ctypes.byref(buf)) == 0:
+            _statx = fn
+        else:
+            # Kernel < 4.11 returns ENOSYS
+            _statx = False
+    except (OSError, AttributeError):
+        _statx = False
+    return _statx
+
+
+def statx_fast(path) -> "tuple[int, int, float]":
+    """
+    Returns (size, mode, mtime) for path.
+    Uses statx with a minimal field mask where available, os.stat otherwise.
+    Raises OSError on lookup failure, like os.stat.
+    """
+    fn = _statx if _statx is not None else _probe()
+    if fn:
+        buf = _Statx()
+        if fn(AT_FDCWD, os.fsencode(path), _FLAGS, _REQUEST_MASK,
+              ctypes.byref(buf)) == 0:
+            mt = buf.stx_mtime
+            return buf.stx_size, buf.stx_mode, mt.tv_sec + mt.tv_nsec * 1e-9
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), str(path))
+    st = os.stat(path, follow_symlinks=False)
+    return st.st_size, st.st_mode, st.st_mtime
@@ -1,14 +1,29 @@
 import os
 import sys
+import threading
+import mmap
 import shutil
+import sqlite3
+import errno
 import hashlib
 import argparse
 import logging
 import stat
-import re
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Tuple
+
+from linux_stat import statx_fast
+
+try:
+    # Optional accelerator: SIMD + multi-threaded hashing, several GB/s.
+    # Dedup only needs content equality, not cryptographic strength.
+    import blake3
+    _HAS_BLAKE3 = True
+except ImportError:
+    _HAS_BLAKE3 = False
 
 
 # --- TERMINAL COLORS ---
@@ -21,27 +36,252 @@ class Colors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
+    @classmethod
+    def disable(cls):
+        """Strips the ANSI codes when stdout is not a terminal (pipe/tee/cron)."""
+        for name in ('HEADER', 'BLUE', 'GREEN', 'WARNING', 'FAIL', 'ENDC', 'BOLD'):
+            setattr(cls, name, '')
+
 
 # --- LOGGING SETUP ---
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(message)s' 
-)
+class _DeferredFlushHandler(logging.StreamHandler):
+    """
+    StreamHandler without the flush-per-record: error lines sit in the
+    stream buffer until _flush_output (or interpreter exit) drains it,
+    instead of forcing a write syscall for every logged failure.
+    """
+    def flush(self):
+        pass
+
+
 logger = logging.getLogger("Organizer")
+_log_handler = _DeferredFlushHandler()
+_log_handler.setFormatter(logging.Formatter('%(message)s'))
+logger.addHandler(_log_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+
+def _new_hasher():
+    """Fastest available content hasher: BLAKE3 when installed, MD5 otherwise."""
+    if _HAS_BLAKE3:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.md5()
+
+
+# Which backend produced a digest matters: cached blake3 and md5 values
+# must never be compared against each other
+_HASH_ALGO = 'blake3' if _HAS_BLAKE3 else 'md5'
+
+
+# mmap pays off only in a window: below _MMAP_MIN the map/unmap overhead
+# beats the copy it saves, above _MMAP_MAX a single giant mapping strains
+# the page tables (and 32-bit address spaces) for no throughput gain
+_MMAP_MIN = 1 << 20
+_MMAP_MAX = 1 << 31
+
+
+# All empty files share one digest; computed once per process because the
+# backend (blake3 vs md5) is only known at runtime
+_EMPTY_DIGEST: Optional[str] = None
+
+
+def _empty_digest() -> str:
+    global _EMPTY_DIGEST
+    if _EMPTY_DIGEST is None:
+        _EMPTY_DIGEST = _new_hasher().hexdigest()
+    return _EMPTY_DIGEST
+
+
+def _hash_file(filepath) -> Optional[str]:
+    """
+    Content hash of a single file, or None if unreadable.
+    Module-level worker shared by the hashing pool.
+    """
+    hasher = _new_hasher()
+    try:
+        # buffering=0: all reads below are large, BufferedReader would only
+        # add an extra copy per chunk
+        with open(filepath, 'rb', buffering=0) as f:
+            # fstat on the already-open fd: no second path lookup
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return hasher.hexdigest()
+            if _HAS_BLAKE3 and size > _MMAP_MIN:
+                # blake3's own memory-mapped path: SIMD parallel tree
+                # hashing over the mapping, no Python-level chunking at all
+                hasher.update_mmap(filepath)
+                return hasher.hexdigest()
+            if size < _MMAP_MIN:
+                # Small file: a single read() is cheaper than a mapping
+                hasher.update(f.read())
+                return hasher.hexdigest()
+            if size < _MMAP_MAX:
+                try:
+                    # One C-level pass over the mapping instead of a Python
+                    # read() loop; the kernel streams pages ahead of the hash
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mm, 'madvise'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        hasher.update(mm)
+                    return hasher.hexdigest()
+                except (ValueError, OSError):
+                    pass  # special file or map failure; use chunked reads
+            # Huge (or unmappable) files: 1 MiB readinto chunks on a
+            # preallocated buffer -- one syscall per MiB, no bytes object
+            # allocated per chunk
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                hasher.update(view[:n])
+        return hasher.hexdigest()
+    except OSError:
+        return None
+
+
+# FICLONE instantly clones a file on reflink filesystems (btrfs, XFS).
+# fcntl only ships the constant from 3.12; the raw value covers older
+# interpreters, and non-Linux platforms skip the ioctl entirely
+try:
+    import fcntl
+    _FICLONE = getattr(fcntl, 'FICLONE', 0x40049409) if sys.platform.startswith('linux') else None
+except ImportError:
+    _FICLONE = None
+
+# Digest-cache filename; the cache (and its WAL sidecars) lives inside X
+# and must never be treated as a file to organize
+_HASH_CACHE_NAME = '.dircsl_cache.sqlite'
+
+# dir_fd-relative syscalls skip the per-operation path walk in the kernel;
+# not every platform supports them for every call
+_DIR_FD_OK = (os.unlink in os.supports_dir_fd
+              and os.chmod in os.supports_dir_fd
+              and os.rename in os.supports_dir_fd)
+
+
+def _head_hash(filepath) -> Optional[str]:
+    """
+    Hash of the first 64 KiB only -- the cheap middle tier of the
+    size -> head -> full dedup cascade. Files that differ almost always
+    differ within the first block, so most full reads never happen.
+    """
+    hasher = _new_hasher()
+    try:
+        with open(filepath, 'rb', buffering=0) as f:
+            hasher.update(f.read(65536))
+        return hasher.hexdigest()
+    except OSError:
+        return None
+
+
+@dataclass(slots=True)
+class FileInfo:
+    """Metadata snapshot for one file, collected during a single walk."""
+    path: str
+    size: int
+    mode: int
+    name: str
+    mtime: float
+
 
 class FileOrganizer:
-    def __init__(self, target_dir: str, source_dirs: List[str], config_path: str, auto_mode: bool = False):
+    def __init__(self, target_dir: str, source_dirs: List[str], config_path: str,
+                 auto_mode: bool = False, parallel_io: int = 1,
+                 dry_run: bool = False):
         """
         Initializes the Organizer with target directory (X), source directories (Y),
-        configuration, and interaction mode.
+        configuration, and interaction mode. parallel_io > 1 spreads confirmed
+        filesystem mutations over that many threads.
         """
-        self.target_dir = Path(target_dir).resolve()
-        self.source_dirs = [Path(d).resolve() for d in source_dirs]
-        # All directories combined for general cleaning tasks
-        self.all_dirs = [self.target_dir] + self.source_dirs
-        
+        self.target_dir = self._maybe_resolve(target_dir)
+        self.parallel_io = max(1, parallel_io)
+        self.dry_run = dry_run
+        self.source_dirs = [self._maybe_resolve(d) for d in source_dirs]
+        # All directories combined for general cleaning tasks; aliases of
+        # the same directory are deduplicated by (dev, inode) so no tree
+        # gets walked twice
+        self.all_dirs = []
+        seen = set()
+        for d in [self.target_dir] + self.source_dirs:
+            try:
+                st = os.stat(d)
+                key = (st.st_dev, st.st_ino)
+            except OSError:
+                key = str(d)
+            if key not in seen:
+                seen.add(key)
+                self.all_dirs.append(d)
+        # Consolidation iterates sources directly; keep it on the deduped
+        # view too (and never treat an alias of X as a source)
+        self.source_dirs = self.all_dirs[1:]
+
+
         self.auto_mode = auto_mode
         self.config = self._load_config(config_path)
+        self._file_cache: Optional[Dict[str, List[FileInfo]]] = None
+
+        # Compiled once per run: str.endswith matches the whole tuple in a
+        # single C call; casefolded so '.DS_Store'/'.TMP' match too
+        self._temp_suffix_tuple = tuple(ext.casefold() for ext in self.config['temp_ext'])
+
+        # Translation table for filename sanitization: one C-level pass per
+        # name instead of a Python loop of str.replace per bad character
+        self._sanitize_table = str.maketrans(
+            {c: self.config['replace_char'] for c in self.config['bad_chars']})
+        # Most names are clean; a set.isdisjoint precheck rejects them
+        # without building a translated copy of every filename
+        self._bad_char_set = frozenset(self.config['bad_chars'])
+
+        # Per-file progress lines are buffered and written in batches; one
+        # write() per file costs a syscall each on big trees. The lock
+        # keeps --parallel-io workers from racing the append/flush pair.
+        self._out_buffer: List[str] = []
+        self._out_lock = threading.Lock()
+
+        # Persistent digest cache in the target root: repeated runs skip
+        # re-hashing files whose (size, mtime) haven't changed. Opened
+        # lazily on the first digest request so runs that never hash
+        # (and --dry-run in particular) leave no cache file behind.
+        # None = not opened yet, False = unavailable, else the connection.
+        self._hash_db = None
+
+    # 256 lines per write keeps memory flat and the terminal responsive
+    # while still amortizing the syscall across a whole batch
+    _FLUSH_EVERY = 256
+
+    def _emit(self, line: str):
+        """Queues one progress line for batched output. Thread-safe."""
+        with self._out_lock:
+            self._out_buffer.append(line)
+            if len(self._out_buffer) >= self._FLUSH_EVERY:
+                self._flush_locked()
+
+    def _flush_output(self):
+        """Writes all buffered progress lines in a single stdout write,
+        and drains any deferred log records alongside them."""
+        with self._out_lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Flush body; caller must hold _out_lock."""
+        if self._out_buffer:
+            sys.stdout.write('\n'.join(self._out_buffer) + '\n')
+            sys.stdout.flush()
+            self._out_buffer.clear()
+        sys.stderr.flush()
+
+    @staticmethod
+    def _maybe_resolve(p) -> str:
+        """
+        Resolves a path only when it needs it: relative paths and symlinks.
+        Callers that already pass absolute normalized paths (typical in
+        automation) skip the realpath syscall walk entirely. Directory
+        handles are plain strings like everything else on the hot paths;
+        Path survives only at the config boundary.
+        """
+        if not os.path.isabs(p) or os.path.islink(p):
+            return os.path.realpath(p)
+        return os.path.normpath(p)
 
     def _load_config(self, path: str) -> dict:
         """
@@ -82,8 +322,10 @@ class FileOrganizer:
                         if key == 'TMP_FILES':
                             settings['temp_ext'] = [x.strip() for x in val.split(',')]
                         elif key == 'TRICKY_LETTERS':
-                            settings['bad_chars'] = list(val.replace(' ', '')) 
-                            if ' ' in val: settings['bad_chars'].append(' ')
+                            # Ordered dedup; repeated characters (and the old
+                            # strip-then-re-append space dance) would bloat
+                            # the translate table for no reason
+                            settings['bad_chars'] = list(dict.fromkeys(val))
                         elif key == 'TRICKY_LETTER_SUBSTITUTE':
                             settings['replace_char'] = val
                         elif key == 'SUGGESTED_ACCESS':
@@ -100,7 +342,9 @@ class FileOrganizer:
         """
         if self.auto_mode:
             return True
-        
+
+        # Show any buffered progress before blocking on the prompt
+        self._flush_output()
         while True:
             response = input(f"{Colors.BLUE}{question} [y/n/all]: {Colors.ENDC}").lower().strip()
             if response in ['y', 'yes']:
@@ -112,201 +356,797 @@ class FileOrganizer:
                 print(f"{Colors.BOLD}Auto-mode enabled for remaining operations.{Colors.ENDC}")
                 return True
 
-    def _calculate_hash(self, filepath: Path) -> Optional[str]:
-        """Calculates MD5 hash for content comparison. Optimized for large files."""
-        hasher = hashlib.md5()
+    def _open_hash_db(self):
+        """
+        Opens (creating on first use) the on-disk digest cache next to the
+        consolidated files. Returns False when the target root is missing or
+        unwritable; hashing then simply runs uncached.
+        """
+        try:
+            db = sqlite3.connect(
+                os.path.join(self.target_dir, _HASH_CACHE_NAME))
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("CREATE TABLE IF NOT EXISTS hashes ("
+                       "path TEXT PRIMARY KEY, size INTEGER, "
+                       "mtime REAL, digest TEXT, algo TEXT)")
+            # Migrate pre-algo caches by starting over; digests without a
+            # recorded backend cannot be trusted across installs
+            cols = {row[1] for row in db.execute("PRAGMA table_info(hashes)")}
+            if 'algo' not in cols:
+                db.execute("DROP TABLE hashes")
+                db.execute("CREATE TABLE hashes ("
+                           "path TEXT PRIMARY KEY, size INTEGER, "
+                           "mtime REAL, digest TEXT, algo TEXT)")
+            return db
+        except sqlite3.Error:
+            return False
+
+    def _hash_cached(self, infos: List[FileInfo]) -> Dict[str, Optional[str]]:
+        """
+        Full digests for a batch of files. Rows whose (size, mtime) still
+        match are served from the persistent cache; the rest are hashed and
+        stored, turning repeat consolidation runs into pure metadata scans.
+        """
+        if self.dry_run:
+            db = False
+        else:
+            if self._hash_db is None:
+                self._hash_db = self._open_hash_db()
+            db = self._hash_db
+        digests: Dict[str, Optional[str]] = {}
+        misses: List[FileInfo] = []
+        lookup = db.execute if db else None
+        for info in infos:
+            if info.size == 0:
+                # Every empty file has the same digest; skip the open()
+                digests[info.path] = _empty_digest()
+                continue
+            row = lookup and lookup(
+                "SELECT size, mtime, digest, algo FROM hashes "
+                "WHERE path = ?", (info.path,)).fetchone()
+            # Rows hashed by a different backend are treated as misses,
+            # otherwise installing blake3 would compare stale md5 digests
+            # against fresh blake3 ones and miss real duplicates
+            if (row and row[0] == info.size and row[1] == info.mtime
+                    and row[3] == _HASH_ALGO):
+                digests[info.path] = row[2]
+            else:
+                misses.append(info)
+        if misses:
+            fresh = self._hash_many([i.path for i in misses])
+            digests.update(fresh)
+            if db:
+                db.executemany(
+                    "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?)",
+                    [(i.path, i.size, i.mtime, fresh[i.path], _HASH_ALGO)
+                     for i in misses if fresh[i.path]])
+                db.commit()
+        return digests
+
+    def _prune_hash_db(self):
+        """
+        Drops cache rows whose file no longer exists -- deleted junk and
+        moved-away source files would otherwise accumulate forever. One
+        lstat per row, so it runs once at the end of a consolidation.
+        """
+        db = self._hash_db
+        if not db:
+            return
+        try:
+            exists = os.path.lexists
+            stale = [(path,) for (path,) in db.execute("SELECT path FROM hashes")
+                     if not exists(path)]
+            if stale:
+                db.executemany("DELETE FROM hashes WHERE path = ?", stale)
+                db.commit()
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def _by_parent(infos: List[FileInfo]) -> Dict[str, List[FileInfo]]:
+        """Groups files by containing directory for dir_fd-relative syscalls."""
+        groups: Dict[str, List[FileInfo]] = {}
+        for info in infos:
+            groups.setdefault(os.path.dirname(info.path), []).append(info)
+        return groups
+
+    @staticmethod
+    def _open_dir(parent: str) -> Optional[int]:
+        """Opens a directory fd for *at-style calls; None if unsupported."""
+        if not _DIR_FD_OK:
+            return None
         try:
-            with open(filepath, 'rb') as f:
-                # Read in 8KB chunks to avoid memory issues
-                while chunk := f.read(8192):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
+            return os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
         except OSError:
             return None
 
+    def _fan_out(self, fn, items):
+        """
+        Runs a confirmed mutation over a batch. With --parallel-io above 1
+        the syscalls go through a thread pool -- unlink/rename/chmod release
+        the GIL, so on high-latency (network) filesystems the round-trips
+        overlap. The default stays serial: on local disks parallelism is
+        roughly neutral and serial keeps output ordering deterministic.
+        """
+        if self.parallel_io > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=self.parallel_io) as executor:
+                for _ in executor.map(fn, items):
+                    pass
+        else:
+            for item in items:
+                fn(item)
+
+    def _unlink_batch(self, infos: List[FileInfo], labels: Dict[str, str]) -> set:
+        """
+        Unlinks a batch of files grouped by parent directory. Each directory
+        is opened once and the files are removed relative to its fd, so the
+        kernel resolves the directory path once per batch instead of once
+        per file. Under --parallel-io the batch fans out by full path
+        instead; the decisions are already recorded, so order is free.
+        labels maps each path to the reason shown in its progress line.
+        """
+        emit = self._emit
+        fail, endc = Colors.FAIL, Colors.ENDC
+        deleted = set()
+        if self.parallel_io > 1:
+            def _rm(info):
+                try:
+                    os.unlink(info.path)
+                    deleted.add(info.path)
+                    emit(f"{fail}Deleted {labels[info.path]}: {info.path}{endc}")
+                except OSError as e:
+                    logger.error(f"Error accessing {info.path}: {e}")
+            self._fan_out(_rm, infos)
+            return deleted
+        for parent, group in self._by_parent(infos).items():
+            dir_fd = self._open_dir(parent)
+            try:
+                for info in group:
+                    try:
+                        if dir_fd is not None:
+                            os.unlink(info.name, dir_fd=dir_fd)
+                        else:
+                            os.unlink(info.path)
+                        deleted.add(info.path)
+                        emit(f"{fail}Deleted {labels[info.path]}: {info.path}{endc}")
+                    except OSError as e:
+                        logger.error(f"Error accessing {info.path}: {e}")
+            finally:
+                if dir_fd is not None:
+                    os.close(dir_fd)
+        return deleted
+
+    def _confirm_batch(self, description: str, items: List[str]) -> bool:
+        """
+        Single summary prompt for a whole category of planned operations.
+        Replaces one blocking prompt per file; 'l' lists the affected files.
+        """
+        if not items:
+            return False
+        if self.auto_mode:
+            return True
+
+        self._flush_output()
+        while True:
+            response = input(
+                f"{Colors.BLUE}{description} ({len(items)} files). Proceed? "
+                f"[y/n/l(ist)]: {Colors.ENDC}").lower().strip()
+            if response in ('y', 'yes'):
+                return True
+            if response in ('n', 'no'):
+                return False
+            if response in ('l', 'list'):
+                print('\n'.join(f"  {item}" for item in items))
+
+    def _build_file_cache(self, directory) -> List[FileInfo]:
+        """
+        Walks a directory once and snapshots the metadata every pass needs.
+        Each directory is fully drained (one burst of getdents64 calls via
+        scandir) before its files are stat'd in a tight batch, instead of
+        interleaving directory reads with metadata lookups.
+        """
+        cache = []
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.error(f"Error scanning {current}: {e}")
+                continue
+
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+
+            # Batched metadata phase for this directory
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if entry.name.startswith(_HASH_CACHE_NAME):
+                    continue  # our own digest cache (+ WAL/SHM sidecars)
+                try:
+                    # statx with a minimal field mask; falls back to stat off-Linux
+                    size, mode, mtime = statx_fast(entry.path)
+                except OSError:
+                    continue
+                cache.append(FileInfo(entry.path, size, mode, entry.name, mtime))
+        return cache
+
+    def _snapshot(self) -> Dict[str, List[FileInfo]]:
+        """
+        Builds the per-directory file cache for every managed directory.
+        Directories are walked concurrently -- scandir/statx release the GIL,
+        so independent trees overlap their metadata syscalls. All mutating
+        operations stay on the main thread.
+        """
+        dirs = [d for d in self.all_dirs if os.path.isdir(d)]
+        if len(dirs) < 2:
+            return {d: self._build_file_cache(d) for d in dirs}
+        workers = min(32, (os.cpu_count() or 4) * 4, len(dirs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(dirs, executor.map(self._build_file_cache, dirs)))
+
+    def _hash_many(self, paths: List[str], fn=_hash_file) -> Dict[str, Optional[str]]:
+        """
+        Runs a hash worker over a batch of files in a thread pool. hashlib
+        and blake3 release the GIL inside update(), and the reads overlap
+        on SSD/NVMe queue depth, so threads deliver the parallelism without
+        process startup or per-path argument pickling. Oversubscribe the
+        cores because the workers spend much of their time in I/O waits.
+        """
+        if len(paths) < 2:
+            return {p: fn(p) for p in paths}
+        workers = min(32, (os.cpu_count() or 4) * 4, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(paths, executor.map(fn, paths)))
+
     # ==========================
     # === CORE ACTION METHODS ===
     # ==========================
 
-    def remove_empty_and_temp(self):
-        """Scans for and removes empty files and files with temporary extensions."""
+    def _preview(self, verb: str, items: List[str]) -> bool:
+        """In --dry-run, prints the planned operations instead of applying."""
+        if not self.dry_run:
+            return False
+        for item in items:
+            self._emit(f"[dry-run] would {verb}: {item}")
+        self._flush_output()
+        return True
+
+    def _scan_junk(self, cache, check_empty: bool = True,
+                   check_temp: bool = True) -> List[Tuple[FileInfo, str]]:
+        """
+        Collects junk deletion candidates off the snapshot as
+        (file, reason) pairs, where reason is EMPTY, TEMP or EMPTY+TEMP.
+        A file matching both checks is listed (and prompted for) once.
+        """
+        # Hoisted out of the walk: the precompiled suffix tuple
+        temp_suffixes = self._temp_suffix_tuple
+        junk: List[Tuple[FileInfo, str]] = []
+        for file_list in cache.values():
+            for info in file_list:
+                # Already-lowercase names (the common case) hit the
+                # casefolded tuple directly, skipping a casefold per file
+                name = info.name
+                is_temp = check_temp and (
+                    name.endswith(temp_suffixes) or (
+                        not name.islower()
+                        and name.casefold().endswith(temp_suffixes)))
+                is_empty = check_empty and info.size == 0
+                if is_temp or is_empty:
+                    junk.append((info, "EMPTY+TEMP" if is_temp and is_empty
+                                 else "TEMP" if is_temp else "EMPTY"))
+        return junk
+
+    def _apply_junk(self, cache, junk: List[Tuple[FileInfo, str]]) -> set:
+        """Confirms and deletes junk candidates, then fixes up the cache.
+        Returns the set of deleted paths."""
+        deleted = set()
+        if self._confirm_batch("About to delete junk files",
+                               [f"{i.path} ({reason})" for i, reason in junk]):
+            labels = {info.path: reason for info, reason in junk}
+            deleted = self._unlink_batch([info for info, _ in junk], labels)
+
+        # Invalidate removed entries so later passes never touch stale paths
+        if deleted:
+            for file_list in cache.values():
+                file_list[:] = [f for f in file_list if f.path not in deleted]
+        self._flush_output()
+        return deleted
+
+    def remove_empty_and_temp(self, files: Optional[Dict[str, List[FileInfo]]] = None,
+                              check_empty: bool = True, check_temp: bool = True):
+        """Scans for and removes empty files and/or temp-extension files."""
         print(f"\n{Colors.HEADER}=== Cleaning Junk Files ==={Colors.ENDC}")
-        temp_exts = self.config['temp_ext']
-        
-        for directory in self.all_dirs:
-            if not directory.exists(): continue
-            
-            for root, _, files in os.walk(directory):
-                for file in files:
-                    path = Path(root) / file
-                    try:
-                        # 1. Check Empty
-                        if path.stat().st_size == 0:
-                            if self._ask_user(f"Remove EMPTY file: {path.name}?"):
-                                path.unlink()
-                                print(f"{Colors.FAIL}Deleted empty: {path}{Colors.ENDC}")
-                                continue
-                        
-                        # 2. Check Temp Extensions
-                        if any(file.endswith(ext) for ext in temp_exts):
-                            if self._ask_user(f"Remove TEMP file: {path.name}?"):
-                                path.unlink()
-                                print(f"{Colors.FAIL}Deleted temp: {path}{Colors.ENDC}")
+        cache = files if files is not None else self._snapshot()
+        junk = self._scan_junk(cache, check_empty, check_temp)
+        if self._preview("delete", [f"{i.path} ({r})" for i, r in junk]):
+            return
+        self._apply_junk(cache, junk)
+
+    def _scan_renames(self, cache) -> List[Tuple[FileInfo, str]]:
+        """Collects (file, sanitized name) pairs via a single-pass translate."""
+        table = self._sanitize_table
+        bad_chars = self._bad_char_set
+        renames: List[Tuple[FileInfo, str]] = []
+        for file_list in cache.values():
+            for info in file_list:
+                if bad_chars.isdisjoint(info.name):
+                    continue
+                renames.append((info, info.name.translate(table)))
+        return renames
 
+    def _apply_renames(self, renames: List[Tuple[FileInfo, str]]):
+        """Confirms and performs the planned renames, keeping the cache in sync."""
+        if self._confirm_batch("About to rename files with tricky characters",
+                               [f"{i.name} -> {n}" for i, n in renames]):
+            if self.parallel_io > 1:
+                def _mv(pair):
+                    info, new_name = pair
+                    parent = os.path.dirname(info.path)
+                    try:
+                        os.rename(info.path, os.path.join(parent, new_name))
+                        info.path = os.path.join(parent, new_name)
+                        info.name = new_name
+                        self._emit(f"{Colors.GREEN}Renamed to: {new_name}{Colors.ENDC}")
                     except OSError as e:
-                        logger.error(f"Error accessing {path}: {e}")
+                        logger.error(f"Rename failed: {e}")
+                self._fan_out(_mv, renames)
+                self._flush_output()
+                return
+            planned = self._by_parent([info for info, _ in renames])
+            new_names = {info.path: n for info, n in renames}
+            for parent, group in planned.items():
+                dir_fd = self._open_dir(parent)
+                try:
+                    for info in group:
+                        new_name = new_names[info.path]
+                        try:
+                            if dir_fd is not None:
+                                os.rename(info.name, new_name,
+                                          src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+                            else:
+                                os.rename(info.path,
+                                          os.path.join(parent, new_name))
+                            # Keep the cache in sync for the passes that follow
+                            info.path = os.path.join(parent, new_name)
+                            info.name = new_name
+                            self._emit(f"{Colors.GREEN}Renamed to: {new_name}{Colors.ENDC}")
+                        except OSError as e:
+                            logger.error(f"Rename failed: {e}")
+                finally:
+                    if dir_fd is not None:
+                        os.close(dir_fd)
+        self._flush_output()
 
-    def sanitize_filenames(self):
+    def sanitize_filenames(self, files: Optional[Dict[str, List[FileInfo]]] = None):
         """Renames files that contain 'bad' characters defined in config."""
         print(f"\n{Colors.HEADER}=== Sanitizing Filenames ==={Colors.ENDC}")
-        bad_chars = self.config['bad_chars']
-        replace_char = self.config['replace_char']
-
-        for directory in self.all_dirs:
-            if not directory.exists(): continue
-            
-            # topdown=False is required when modifying names while traversing
-            for root, _, files in os.walk(directory, topdown=False):
-                for file in files:
-                    new_name = file
-                    for char in bad_chars:
-                        new_name = new_name.replace(char, replace_char)
-                    
-                    if new_name != file:
-                        old_path = Path(root) / file
-                        new_path = Path(root) / new_name
-                        
-                        print(f"Tricky name found: {file}")
-                        if self._ask_user(f"Rename to '{new_name}'?"):
-                            try:
-                                old_path.rename(new_path)
-                                print(f"{Colors.GREEN}Renamed to: {new_name}{Colors.ENDC}")
-                            except OSError as e:
-                                logger.error(f"Rename failed: {e}")
+        cache = files if files is not None else self._snapshot()
+        renames = self._scan_renames(cache)
+        if self._preview("rename", [f"{i.path} -> {n}" for i, n in renames]):
+            return
+        self._apply_renames(renames)
 
-    def fix_permissions(self):
-        """Resets file permissions to the default value (e.g., 644)."""
-        print(f"\n{Colors.HEADER}=== Fixing Permissions ==={Colors.ENDC}")
-        target_mode = self.config['perms']
-        
-        for directory in self.all_dirs:
-            if not directory.exists(): continue
-            for root, _, files in os.walk(directory):
-                for file in files:
-                    path = Path(root) / file
+    def _scan_perms(self, cache, target_mode: int) -> List[FileInfo]:
+        """Collects files whose permission bits differ from the target."""
+        imode = stat.S_IMODE
+        return [info for file_list in cache.values() for info in file_list
+                if imode(info.mode) != target_mode]
+
+    def _apply_perms(self, candidates: List[FileInfo], target_mode: int):
+        """Confirms and applies the chmod batch."""
+        imode = stat.S_IMODE
+        green, endc = Colors.GREEN, Colors.ENDC
+
+        # In auto mode skip formatting the per-file mode diff entirely --
+        # the answer is always yes and the strings would be thrown away.
+        if self.auto_mode:
+            confirmed = bool(candidates)
+        else:
+            confirmed = self._confirm_batch(
+                f"About to chmod files to {oct(target_mode)}",
+                [f"{i.path} ({oct(imode(i.mode))})" for i in candidates])
+        if confirmed:
+            if self.parallel_io > 1:
+                def _chmod(info):
                     try:
-                        # Get current permissions
-                        current = stat.S_IMODE(path.stat().st_mode)
-                        if current != target_mode:
-                            if self._ask_user(f"Fix permissions for {path.name} ({oct(current)} -> {oct(target_mode)})?"):
-                                path.chmod(target_mode)
-                                print(f"{Colors.GREEN}Fixed: {path.name}{Colors.ENDC}")
+                        os.chmod(info.path, target_mode)
+                        info.mode = target_mode
+                        self._emit(f"{green}Fixed: {info.name}{endc}")
                     except OSError:
                         pass
+                self._fan_out(_chmod, candidates)
+                self._flush_output()
+                return
+            for parent, group in self._by_parent(candidates).items():
+                dir_fd = self._open_dir(parent)
+                try:
+                    for info in group:
+                        try:
+                            if dir_fd is not None:
+                                os.chmod(info.name, target_mode, dir_fd=dir_fd)
+                            else:
+                                os.chmod(info.path, target_mode)
+                            info.mode = target_mode
+                            self._emit(f"{green}Fixed: {info.name}{endc}")
+                        except OSError:
+                            pass
+                finally:
+                    if dir_fd is not None:
+                        os.close(dir_fd)
+        self._flush_output()
 
-    def consolidate_and_dedup(self):
+    def fix_permissions(self, files: Optional[Dict[str, List[FileInfo]]] = None):
+        """Resets file permissions to the default value (e.g., 644)."""
+        print(f"\n{Colors.HEADER}=== Fixing Permissions ==={Colors.ENDC}")
+        target_mode = self.config['perms']
+        cache = files if files is not None else self._snapshot()
+        candidates = self._scan_perms(cache, target_mode)
+        if self._preview(f"chmod to {oct(target_mode)}",
+                         [i.path for i in candidates]):
+            return
+        self._apply_perms(candidates, target_mode)
+
+
+    @staticmethod
+    def _copy_bytes(src: str, dst: str):
+        """
+        Copies file contents with the kernel doing as much of the work as
+        possible: copy_file_range can reflink or offload the copy entirely,
+        FICLONE clones instantly on reflink filesystems, and sendfile at
+        least keeps the bytes out of userspace. A chunked copyfileobj is
+        the portable last resort. Each fallback restarts from offset zero.
+        """
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            sfd, dfd = fsrc.fileno(), fdst.fileno()
+            size = os.fstat(sfd).st_size
+            if size == 0:
+                return
+
+            def _rewind():
+                os.ftruncate(dfd, 0)
+                os.lseek(dfd, 0, os.SEEK_SET)
+                os.lseek(sfd, 0, os.SEEK_SET)
+
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    done = 0
+                    while done < size:
+                        n = os.copy_file_range(sfd, dfd, size - done)
+                        if n == 0:
+                            break
+                        done += n
+                    if done >= size:
+                        return
+                except OSError:
+                    pass
+                _rewind()
+            if _FICLONE is not None:
+                try:
+                    fcntl.ioctl(dfd, _FICLONE, sfd)
+                    return
+                except OSError:
+                    _rewind()
+            if hasattr(os, 'sendfile'):
+                try:
+                    done = 0
+                    while done < size:
+                        n = os.sendfile(dfd, sfd, done, size - done)
+                        if n == 0:
+                            break
+                        done += n
+                    if done >= size:
+                        return
+                except OSError:
+                    pass
+                _rewind()
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+
+    @classmethod
+    def _move(cls, src: str, dst: str):
+        """
+        Moves src onto dst. os.replace is one atomic rename syscall and
+        covers the common same-filesystem case; a cross-device move (EXDEV)
+        goes through the kernel-side copy chain plus copystat, so timestamps
+        survive for the mtime-based decisions, then unlinks the source.
+        """
+        try:
+            os.replace(src, dst)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+        cls._copy_bytes(src, dst)
+        shutil.copystat(src, dst)
+        os.unlink(src)
+
+    @staticmethod
+    def _register_in_x(x_by_size, x_by_hash, x_info_by_path, dirty_sizes,
+                       info: FileInfo, dest_path: str,
+                       src_hash: Optional[str]):
+        """Records a file just moved into X so later source files dedup
+        against it. The size bucket is marked dirty: head-hash verdicts
+        taken before this move no longer cover the bucket."""
+        moved = FileInfo(dest_path, info.size, info.mode,
+                         os.path.basename(dest_path), info.mtime)
+        x_by_size.setdefault(info.size, []).append(moved)
+        x_info_by_path[dest_path] = moved
+        dirty_sizes.add(info.size)
+        if src_hash:
+            x_by_hash[src_hash] = moved
+
+    def consolidate_and_dedup(self, files: Optional[Dict[str, List[FileInfo]]] = None):
         """
         Merges files from Source Directories (Y) into Target Directory (X).
         - Content Duplicates: Keeps the OLDEST file.
         - Name Collisions: Keeps the NEWEST file.
         """
         print(f"\n{Colors.HEADER}=== Consolidating to Target (X) ==={Colors.ENDC}")
-        
-        # Index the Target Directory (X)
+        cache = files if files is not None else self._snapshot()
+
+        # Index the Target Directory (X) by size only -- a few dozen bytes
+        # per file. The {hash: FileInfo} map is promoted lazily, bucket by
+        # bucket, the first time a source file collides on size, so
+        # uniquely-sized files on either side are never read at all and no
+        # up-front hashing pass delays the first visible progress
         print("Indexing Target Directory...")
-        x_index = {} # {hash: Path}
-        
-        if self.target_dir.exists():
-            for root, _, files in os.walk(self.target_dir):
-                for file in files:
-                    path = Path(root) / file
-                    h = self._calculate_hash(path)
-                    if h:
-                        # If duplicate inside X, ensure index points to the oldest one
-                        if h not in x_index or path.stat().st_mtime < x_index[h].stat().st_mtime:
-                            x_index[h] = path
-
-        # Process Source Directories (Y)
+        x_by_size: Dict[int, List[FileInfo]] = {}
+        x_info_by_path: Dict[str, FileInfo] = {}
+        for info in cache.get(self.target_dir, []):
+            x_by_size.setdefault(info.size, []).append(info)
+            x_info_by_path[info.path] = info
+
+        x_by_hash: Dict[str, FileInfo] = {} # {hash: FileInfo}, promoted lazily
+        x_head_cache: Dict[str, Optional[str]] = {} # X path -> head hash
+        x_full_done = set() # X paths already promoted into x_by_hash
+
+        def promote_full(xinfos):
+            """Full-hashes X-side entries into x_by_hash (oldest wins)."""
+            todo = [x for x in xinfos if x.path not in x_full_done]
+            x_full_done.update(x.path for x in todo)
+            hashes = self._hash_cached(todo)
+            for x in todo:
+                h = hashes[x.path]
+                if h:
+                    # If duplicate inside X, ensure index points to the
+                    # oldest one -- mtimes come from the walk, no re-stat
+                    cur = x_by_hash.get(h)
+                    if cur is None or x.mtime < cur.mtime:
+                        x_by_hash[h] = x
+
+        # Process Source Directories (Y) -- hot loop works on plain strings
+        # and on locals: LOAD_FAST beats repeated attribute/global lookups
+        # in a loop that runs once per file
+        target_root = self.target_dir
+        emit = self._emit
+        ask = self._ask_user
+        move = self._move
+        register = self._register_in_x
+        fromts = datetime.fromtimestamp
+        makedirs = os.makedirs
+        relpath, joinpath, dirname = os.path.relpath, os.path.join, os.path.dirname
+        warn, green, fail, endc = (Colors.WARNING, Colors.GREEN,
+                                   Colors.FAIL, Colors.ENDC)
         for source_dir in self.source_dirs:
-            if not source_dir.exists(): 
+            if source_dir not in cache:
                 print(f"{Colors.WARNING}Source not found: {source_dir}{Colors.ENDC}")
                 continue
-            
+
             print(f"Scanning Source: {source_dir}")
-            
-            for root, _, files in os.walk(source_dir):
-                for file in files:
-                    src_path = Path(root) / file
-                    src_hash = self._calculate_hash(src_path)
-                    
+
+            # Tier 1 -- size: only source files whose size collides with X
+            # can be duplicates; everything else skips hashing entirely
+            src_list = cache[source_dir]
+            sized = [i for i in src_list if i.size in x_by_size]
+
+            # Tier 2 -- 64 KiB head hash on both sides of colliding
+            # buckets. Zero-byte files never get opened: both sides are
+            # seeded with the shared empty digest instead.
+            empty_d = _empty_digest()
+            if any(i.size == 0 for i in sized):
+                for x in x_by_size.get(0, ()):
+                    x_head_cache.setdefault(x.path, empty_d)
+            x_side = [x.path for i in sized if i.size
+                      for x in x_by_size[i.size]
+                      if x.path not in x_head_cache]
+            heads = self._hash_many(
+                [i.path for i in sized if i.size] + x_side, fn=_head_hash)
+            for i in sized:
+                if i.size == 0:
+                    heads[i.path] = empty_d
+            for xpath in x_side:
+                x_head_cache[xpath] = heads[xpath]
+
+            # Tier 3 -- full hash only where size AND head both collide.
+            # dirty_sizes tracks buckets that gain X entries mid-loop,
+            # whose scan-time screening verdicts are then stale.
+            screened = set()
+            dirty_sizes = set()
+            unreadable = set()
+            full_src = []
+            full_x = {}
+            for i in sized:
+                head = heads.get(i.path)
+                if head is None:
+                    unreadable.add(i.path)
+                    continue
+                screened.add(i.path)
+                matches = [x for x in x_by_size[i.size]
+                           if x_head_cache.get(x.path) == head]
+                if matches:
+                    full_src.append(i)
+                    full_x.update((x.path, x) for x in matches)
+            promote_full(full_x.values())
+            src_hashes = self._hash_cached(full_src)
+
+            for info in src_list:
+                src_path = info.path
+                if src_path in unreadable:
+                    continue
+                if src_path in src_hashes:
+                    src_hash = src_hashes[src_path]
+                    if not src_hash: continue  # unreadable
+                elif src_path in screened and info.size not in dirty_sizes:
+                    src_hash = None  # head hash ruled out any X duplicate
+                elif info.size in x_by_size:
+                    # Bucket is new or gained entries mid-run (a file was
+                    # just moved to X); re-check against its current state
+                    promote_full(x_by_size[info.size])
+                    src_hash = self._hash_cached([info])[src_path]
                     if not src_hash: continue
+                else:
+                    src_hash = None  # unique size -> cannot duplicate X content
 
-                    # --- SCENARIO A: Content Duplicate Found ---
-                    if src_hash in x_index:
-                        existing = x_index[src_hash]
-                        src_time = src_path.stat().st_mtime
-                        dst_time = existing.stat().st_mtime
-                        
-                        # Task: Suggest keeping oldest
-                        if src_time < dst_time:
-                            print(f"{Colors.WARNING}Duplicate found! Source is OLDER (Original).{Colors.ENDC}")
-                            print(f" Source: {src_path} ({datetime.fromtimestamp(src_time)})")
-                            print(f" Target: {existing} ({datetime.fromtimestamp(dst_time)})")
-                            
-                            if self._ask_user("Replace newer file in X with older original from Y?"):
+                # --- SCENARIO A: Content Duplicate Found ---
+                if src_hash and src_hash in x_by_hash:
+                    existing = x_by_hash[src_hash]
+                    src_time = info.mtime
+                    dst_time = existing.mtime
+
+                    # Task: Suggest keeping oldest
+                    if src_time < dst_time:
+                        emit(f"{warn}Duplicate found! Source is OLDER (Original).{endc}")
+                        emit(f" Source: {src_path} ({fromts(src_time)})")
+                        emit(f" Target: {existing.path} ({fromts(dst_time)})")
+
+                        if ask("Replace newer file in X with older original from Y?"):
+                            try:
+                                move(src_path, existing.path)
+                                existing.mtime = info.mtime
+                                emit(f"{green}Restored original to X.{endc}")
+                            except OSError as e:
+                                logger.error(f"Move failed: {e}")
+                    else:
+                        if ask(f"Delete duplicate copy in Y: {info.name}?"):
+                            try:
+                                os.unlink(src_path)
+                                emit(f"{fail}Deleted duplicate.{endc}")
+                            except OSError as e:
+                                logger.error(f"Delete failed: {e}")
+
+                # --- SCENARIO B: Unique Content (Move to X) ---
+                else:
+                    rel_path = relpath(src_path, source_dir)
+                    dest_path = joinpath(target_root, rel_path)
+
+                    # Handle Name Collisions (Different content, same name)
+                    # The X index stands in for os.path.exists + two stats
+                    existing_dest = x_info_by_path.get(dest_path)
+                    if existing_dest is not None:
+                        src_time = info.mtime
+                        dst_time = existing_dest.mtime
+
+                        # Task: "W przypadku plików o tej samej nazwie sugerować pozostawienie nowszego"
+                        if src_time > dst_time:
+                            emit(f"{warn}Name Conflict! Source is NEWER.{endc}")
+                            emit(f" Source: {src_path} ({fromts(src_time)})")
+                            emit(f" Target: {dest_path} ({fromts(dst_time)})")
+
+                            if ask(f"Overwrite older {info.name} with newer version?"):
                                 try:
-                                    shutil.move(str(src_path), str(existing))
-                                    print(f"{Colors.GREEN}Restored original to X.{Colors.ENDC}")
+                                    makedirs(dirname(dest_path), exist_ok=True)
+                                    move(src_path, dest_path)
+                                    register(x_by_size, x_by_hash, x_info_by_path, dirty_sizes, info, dest_path, src_hash)
+                                    emit(f"{green}Updated file.{endc}")
                                 except OSError as e:
-                                    logger.error(f"Move failed: {e}")
+                                    logger.error(f"Overwrite failed: {e}")
                         else:
-                            if self._ask_user(f"Delete duplicate copy in Y: {src_path.name}?"):
-                                try:
-                                    src_path.unlink()
-                                    print(f"{Colors.FAIL}Deleted duplicate.{Colors.ENDC}")
-                                except OSError as e:
-                                    logger.error(f"Delete failed: {e}")
-                    
-                    # --- SCENARIO B: Unique Content (Move to X) ---
+                            emit(f"Skipping older/same version: {info.name}")
                     else:
-                        try:
-                            rel_path = src_path.relative_to(source_dir)
-                        except ValueError:
-                            rel_path = src_path.name
-                        
-                        dest_path = self.target_dir / rel_path
-                        
-                        # Handle Name Collisions (Different content, same name)
-                        if dest_path.exists():
-                            src_time = src_path.stat().st_mtime
-                            dst_time = dest_path.stat().st_mtime
-                            
-                            # Task: "W przypadku plików o tej samej nazwie sugerować pozostawienie nowszego"
-                            if src_time > dst_time:
-                                print(f"{Colors.WARNING}Name Conflict! Source is NEWER.{Colors.ENDC}")
-                                print(f" Source: {src_path} ({datetime.fromtimestamp(src_time)})")
-                                print(f" Target: {dest_path} ({datetime.fromtimestamp(dst_time)})")
-                                
-                                if self._ask_user(f"Overwrite older {dest_path.name} with newer version?"):
-                                    try:
-                                        dest_path.parent.mkdir(parents=True, exist_ok=True)
-                                        shutil.move(str(src_path), str(dest_path))
-                                        x_index[src_hash] = dest_path # Update index
-                                        print(f"{Colors.GREEN}Updated file.{Colors.ENDC}")
-                                    except OSError as e:
-                                        logger.error(f"Overwrite failed: {e}")
-                            else:
-                                print(f"Skipping older/same version: {src_path.name}")
-                        else:
-                            # No collision, simple move
-                            if self._ask_user(f"Move unique file {src_path.name} to X?"):
-                                try:
-                                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                                    shutil.move(str(src_path), str(dest_path))
-                                    x_index[src_hash] = dest_path # Update index
-                                    print(f"{Colors.GREEN}Moved.{Colors.ENDC}")
-                                except OSError as e:
-                                    logger.error(f"Move failed: {e}")
+                        # No collision, simple move
+                        if ask(f"Move unique file {info.name} to X?"):
+                            try:
+                                makedirs(dirname(dest_path), exist_ok=True)
+                                move(src_path, dest_path)
+                                register(x_by_size, x_by_hash, x_info_by_path, dirty_sizes, info, dest_path, src_hash)
+                                emit(f"{green}Moved.{endc}")
+                            except OSError as e:
+                                logger.error(f"Move failed: {e}")
+
+            # Everything in this source is decided; drop its snapshot so
+            # peak memory is bounded by one source tree at a time
+            src_list.clear()
+        self._prune_hash_db()
+        self._flush_output()
+
+    def _scan_all(self, cache, do_empty: bool, do_temp: bool,
+                  do_sanitize: bool, do_perms: bool):
+        """
+        Evaluates every requested per-file predicate in a single pass over
+        the snapshot, so combining actions costs one loop instead of one
+        loop per action. Returns the same candidate structures the
+        individual _scan_* methods produce.
+        """
+        temp_suffixes = self._temp_suffix_tuple
+        table = self._sanitize_table
+        bad_chars = self._bad_char_set
+        imode = stat.S_IMODE
+        target_mode = self.config['perms']
+        junk: List[Tuple[FileInfo, str]] = []
+        renames: List[Tuple[FileInfo, str]] = []
+        perm_candidates: List[FileInfo] = []
+        for file_list in cache.values():
+            for info in file_list:
+                name = info.name
+                if do_empty or do_temp:
+                    is_temp = do_temp and (
+                        name.endswith(temp_suffixes) or (
+                            not name.islower()
+                            and name.casefold().endswith(temp_suffixes)))
+                    is_empty = do_empty and info.size == 0
+                    if is_temp or is_empty:
+                        junk.append((info,
+                                     "EMPTY+TEMP" if is_temp and is_empty
+                                     else "TEMP" if is_temp else "EMPTY"))
+                if do_sanitize and not bad_chars.isdisjoint(name):
+                    renames.append((info, name.translate(table)))
+                if do_perms and imode(info.mode) != target_mode:
+                    perm_candidates.append(info)
+        return junk, renames, perm_candidates
+
+    def run_all(self, do_empty: bool, do_temp: bool, do_sanitize: bool,
+                do_perms: bool, do_dedup: bool):
+        """
+        Runs the selected passes off a single metadata snapshot and a single
+        fused predicate pass. Every directory is walked (and every file
+        stat'd) exactly once, and the per-file checks for all requested
+        actions run in one loop over the cache.
+        """
+        cache = self._file_cache = self._snapshot()
+        junk, renames, perm_candidates = \
+            self._scan_all(cache, do_empty, do_temp, do_sanitize, do_perms)
+        if do_empty or do_temp:
+            print(f"\n{Colors.HEADER}=== Cleaning Junk Files ==={Colors.ENDC}")
+            if not self._preview("delete",
+                                 [f"{i.path} ({r})" for i, r in junk]):
+                deleted = self._apply_junk(cache, junk)
+                if deleted:
+                    # Drop just-deleted files from the later candidate lists
+                    renames = [(i, n) for i, n in renames
+                               if i.path not in deleted]
+                    perm_candidates = [i for i in perm_candidates
+                                       if i.path not in deleted]
+        if do_sanitize:
+            print(f"\n{Colors.HEADER}=== Sanitizing Filenames ==={Colors.ENDC}")
+            if not self._preview("rename",
+                                 [f"{i.path} -> {n}" for i, n in renames]):
+                self._apply_renames(renames)
+        if do_perms:
+            target_mode = self.config['perms']
+            print(f"\n{Colors.HEADER}=== Fixing Permissions ==={Colors.ENDC}")
+            if not self._preview(f"chmod to {oct(target_mode)}",
+                                 [i.path for i in perm_candidates]):
+                self._apply_perms(perm_candidates, target_mode)
+        if do_dedup:
+            if self.dry_run:
+                print(f"{Colors.WARNING}Consolidation is skipped under "
+                      f"--dry-run (its decisions depend on earlier moves)."
+                      f"{Colors.ENDC}")
+            else:
+                self.consolidate_and_dedup(files=cache)
 # --- MAIN EXECUTION ---
 def main():
     parser = argparse.ArgumentParser(description="University Project: File System Organizer")
@@ -325,10 +1165,17 @@ def main():
     
     parser.add_argument("--config", default=".clean_files", help="Path to config file (default: .clean_files)")
     parser.add_argument("--yes", action="store_true", help="Auto-confirm all prompts (Non-interactive)")
+    parser.add_argument("--parallel-io", type=int, default=1, metavar="N",
+                        help="Threads for confirmed delete/rename/chmod batches (useful on network filesystems; default 1)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only print the operations that would be performed")
 
     args = parser.parse_args()
-    
-    
+
+    # No ANSI noise (and no per-line escape bytes) when piped or redirected
+    if not sys.stdout.isatty():
+        Colors.disable()
+
     if args.all:
         args.empty = args.temporary = args.sanitize = args.permissions = args.duplicates = True
 
@@ -340,24 +1187,19 @@ def main():
     print(f"{Colors.BOLD}Starting File Organizer...{Colors.ENDC}")
     
     # Initialize the Organizer Object
-    organizer = FileOrganizer(args.target_dir, args.source_dirs, args.config, args.yes)
-    
-    # Execute Steps
-    if args.empty: 
-        organizer.remove_empty_and_temp()
-    if args.temporary and not args.empty:
-        organizer.remove_empty_and_temp()
-        
-    if args.sanitize: 
-        organizer.sanitize_filenames()
-        
-    if args.permissions: 
-        organizer.fix_permissions()
-        
-    if args.duplicates: 
-        organizer.consolidate_and_dedup()
+    organizer = FileOrganizer(args.target_dir, args.source_dirs, args.config, args.yes,
+                              parallel_io=args.parallel_io, dry_run=args.dry_run)
     
-    if not any([args.empty, args.temporary, args.sanitize, args.permissions, args.duplicates]):
+    # Execute Steps (single shared walk, see run_all)
+    if any([args.empty, args.temporary, args.sanitize, args.permissions, args.duplicates]):
+        organizer.run_all(
+            do_empty=args.empty,
+            do_temp=args.temporary,
+            do_sanitize=args.sanitize,
+            do_perms=args.permissions,
+            do_dedup=args.duplicates,
+        )
+    else:
         print(f"{Colors.WARNING}No action selected. Use --all or specific flags like --duplicates.{Colors.ENDC}")
         print(f"Example: python3 file_organizer.py ./X ./Y --all")
 